@@ -1,6 +1,8 @@
 """For decoding and loading .asd AFM file format into Python Numpy arrays."""
 
 from __future__ import annotations
+import mmap
+import os
 from pathlib import Path
 
 from typing import BinaryIO
@@ -8,27 +10,63 @@ from typing import BinaryIO
 
 import numpy as np
 import numpy.typing as npt
-import matplotlib.pyplot as plt
-from matplotlib import animation
 
 
 from AFMReader.logging import logger
+from AFMReader.asd_headers import (
+    _FRAME_HEADER,
+    _FRAME_HEADER_FIELDS,
+    _HEADER_V0,
+    _HEADER_V0_NAMES,
+    _HEADER_V1_V2,
+    _HEADER_V1_V2_NAMES,
+)
 from AFMReader.io import (
     read_int32,
-    read_int16,
     read_float,
-    read_bool,
-    read_hex_u32,
-    read_ascii,
-    read_uint8,
     read_null_separated_utf8,
-    read_int8,
     read_double,
     skip_bytes,
 )
 
 logger.enable(__package__)
 
+# Numba is an optional dependency; when available the frame conversion is compiled and parallelised across
+# cores, otherwise the vectorised NumPy path is used.
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _level_to_voltage_jit(pixels: npt.NDArray, a: np.float32, b: np.float32) -> npt.NDArray:
+        """
+        Convert raw levels to real world heights with a compiled, parallel kernel.
+
+        Parameters
+        ----------
+        pixels : npt.NDArray
+            Signed 16 bit integer cube of raw levels with shape (num_frames, y_pixels, x_pixels).
+        a : np.float32
+            Multiplicative constant of the affine conversion.
+        b : np.float32
+            Additive constant of the affine conversion.
+
+        Returns
+        -------
+        npt.NDArray
+            Float32 cube of real world nanometre heights.
+        """
+        num_frames, y_pixels, x_pixels = pixels.shape
+        out = np.empty((num_frames, y_pixels, x_pixels), dtype=np.float32)
+        for frame in numba.prange(num_frames):  # pylint: disable=not-an-iterable
+            for row in range(y_pixels):
+                for col in range(x_pixels):
+                    out[frame, row, col] = pixels[frame, row, col] * a + b
+        return out
+
 
 # pylint: disable=too-few-public-methods
 class VoltageLevelConverter:
@@ -68,6 +106,10 @@ class VoltageLevelConverter:
         self.ad_range = analogue_digital_range
         self.scaling_factor = scaling_factor
         self.resolution = resolution
+        # Precomputed constants of the affine conversion level * _a + _b, set by subclasses. Precomputing them
+        # here means the per-frame conversion is a single fused multiply-add that NumPy can vectorise.
+        self._a = np.float32(0.0)
+        self._b = np.float32(0.0)
         logger.info(
             f"created voltage converter. ad_range: {analogue_digital_range} -> {self.ad_range}, "
             f" scaling factor: {scaling_factor}, resolution: {resolution}"
@@ -78,6 +120,25 @@ class VoltageLevelConverter:
 class UnipolarConverter(VoltageLevelConverter):
     """A VoltageLevelConverter for unipolar encodings. (0 to +X Volts)."""
 
+    def __init__(self, analogue_digital_range: float, scaling_factor: float, resolution: int) -> None:
+        """
+        Create a unipolar converter with precomputed affine constants.
+
+        Parameters
+        ----------
+        analogue_digital_range : float
+            The range of analogue voltage values.
+        scaling_factor : float
+            A scaling factor calculated elsewhere that scales the heightmap appropriately based on the type of channel
+            and sensor parameters.
+        resolution : int
+            The vertical resolution of the instrument. Dependant on the number of bits used to store its
+            values. Typically 12, hence 2^12 = 4096 sensitivity levels.
+        """
+        super().__init__(analogue_digital_range, scaling_factor, resolution)
+        self._a = np.float32(-analogue_digital_range / resolution * scaling_factor)
+        self._b = np.float32(0.0)
+
     def level_to_voltage(self, level: float) -> float:
         """
         Calculate the real world height scale in nanometres for an arbitrary level value.
@@ -91,16 +152,36 @@ class UnipolarConverter(VoltageLevelConverter):
         Returns
         -------
         float
-            Real world nanometre height for the input height level.
+            Real world nanometre height for the input height level. Arrays are converted in float32
+            precision, halving the memory bandwidth of the conversion compared to the float64 default.
         """
-        multiplier = -self.ad_range / self.resolution * self.scaling_factor
-        return level * multiplier
+        return level * self._a + self._b
 
 
 # pylint: disable=too-few-public-methods
 class BipolarConverter(VoltageLevelConverter):
     """A VoltageLevelConverter for bipolar encodings. (-X to +X Volts)."""
 
+    def __init__(self, analogue_digital_range: float, scaling_factor: float, resolution: int) -> None:
+        """
+        Create a bipolar converter with precomputed affine constants.
+
+        Parameters
+        ----------
+        analogue_digital_range : float
+            The range of analogue voltage values.
+        scaling_factor : float
+            A scaling factor calculated elsewhere that scales the heightmap appropriately based on the type of channel
+            and sensor parameters.
+        resolution : int
+            The vertical resolution of the instrument. Dependant on the number of bits used to store its
+            values. Typically 12, hence 2^12 = 4096 sensitivity levels.
+        """
+        super().__init__(analogue_digital_range, scaling_factor, resolution)
+        # (ad_range - 2 * level * ad_range / resolution) * scaling_factor rearranged into level * _a + _b
+        self._a = np.float32(-2 * analogue_digital_range / resolution * scaling_factor)
+        self._b = np.float32(analogue_digital_range * scaling_factor)
+
     def level_to_voltage(self, level: float) -> float:
         """
         Calculate the real world height scale in nanometres for an arbitrary level value.
@@ -114,9 +195,19 @@ class BipolarConverter(VoltageLevelConverter):
         Returns
         -------
         float
-            Real world nanometre height for the input height level.
+            Real world nanometre height for the input height level. Arrays are converted in float32
+            precision, halving the memory bandwidth of the conversion compared to the float64 default.
         """
-        return (self.ad_range - 2 * level * self.ad_range / self.resolution) * self.scaling_factor
+        return level * self._a + self._b
+
+
+# Lookup table mapping each channel to its scaling factor calculation: topography (TP) scales by piezo gain
+# times piezo extension while error (ER) and phase (PH) scale by the negated sensitivities.
+_CHANNEL_SCALERS = {
+    "TP": lambda z_piezo_gain, z_piezo_extension, **_: z_piezo_gain * z_piezo_extension,
+    "ER": lambda scanner_sensitivity, **_: -scanner_sensitivity,
+    "PH": lambda phase_sensitivity, **_: -phase_sensitivity,
+}
 
 
 def calculate_scaling_factor(
@@ -152,29 +243,150 @@ def calculate_scaling_factor(
         height levels to real world nanometre heights for the frame data in the specified channl
         in the .asd file.
     """
-    if channel == "TP":
-        logger.info(
-            f"Scaling factor: Type: {channel} -> TP | piezo extension {z_piezo_gain} "
-            f"* piezo gain {z_piezo_extension} = scaling factor {z_piezo_gain * z_piezo_extension}"
-        )
-        return z_piezo_gain * z_piezo_extension
-    if channel == "ER":
-        logger.info(
-            f"Scaling factor: Type: {channel} -> ER | - scanner sensitivity {-scanner_sensitivity} "
-            f"= scaling factor {-scanner_sensitivity}"
+    try:
+        scaling_factor = _CHANNEL_SCALERS[channel](
+            z_piezo_gain=z_piezo_gain,
+            z_piezo_extension=z_piezo_extension,
+            scanner_sensitivity=scanner_sensitivity,
+            phase_sensitivity=phase_sensitivity,
         )
-        return -scanner_sensitivity
-    if channel == "PH":
-        logger.info(
-            f"Scaling factor: Type: {channel} -> PH | - phase sensitivity {-phase_sensitivity} "
-            f"= scaling factor {-phase_sensitivity}"
-        )
-        return -phase_sensitivity
+    except KeyError as e:
+        raise ValueError(f"channel {channel} not known for .asd file type.") from e
+    logger.info(f"Scaling factor: Type: {channel} | scaling factor {scaling_factor}")
+    return scaling_factor
 
-    raise ValueError(f"channel {channel} not known for .asd file type.")
 
+class LazyFrames:
+    """
+    A lazy, memory-mapped view of the frames of a .asd channel.
 
-def load_asd(file_path: Path, channel: str):
+    Frames are converted from raw levels to real world nanometre heights only when accessed, so loading a
+    long movie costs constant memory. Instances own the underlying memory map; call `close` (or use the
+    instance as a context manager) when finished with the data.
+
+    Parameters
+    ----------
+    mapped_file : mmap.mmap
+        A read-only memory map of the .asd file, owned by this view.
+    data_offset : int
+        Byte offset of the start of the channel's frame data within the mapping.
+    num_frames : int
+        The number of frames in the channel.
+    x_pixels : int
+        The width of each frame in pixels.
+    y_pixels : int
+        The height of each frame in pixels.
+    analogue_digital_converter : VoltageLevelConverter
+        A VoltageLevelConverter instance for converting the raw level values to real world nanometre vertical heights.
+    frame_header_length : int
+        Length in bytes of the header that precedes each frame's pixel data.
+    """
+
+    def __init__(
+        self,
+        *,
+        mapped_file: mmap.mmap,
+        data_offset: int,
+        num_frames: int,
+        x_pixels: int,
+        y_pixels: int,
+        analogue_digital_converter: VoltageLevelConverter,
+        frame_header_length: int,
+    ) -> None:
+        """
+        Create a lazy view of the frames of a .asd channel.
+
+        Parameters
+        ----------
+        mapped_file : mmap.mmap
+            A read-only memory map of the .asd file, owned by this view.
+        data_offset : int
+            Byte offset of the start of the channel's frame data within the mapping.
+        num_frames : int
+            The number of frames in the channel.
+        x_pixels : int
+            The width of each frame in pixels.
+        y_pixels : int
+            The height of each frame in pixels.
+        analogue_digital_converter : VoltageLevelConverter
+            A VoltageLevelConverter instance for converting the raw level values to real world nanometre
+            vertical heights.
+        frame_header_length : int
+            Length in bytes of the header that precedes each frame's pixel data.
+        """
+        self._mapped_file = mapped_file
+        self._data_offset = data_offset
+        self._converter = analogue_digital_converter
+        self._frame_header_length = frame_header_length
+        self._frame_stride = frame_header_length + x_pixels * y_pixels * 2
+        self.shape = (num_frames, y_pixels, x_pixels)
+
+    def __len__(self) -> int:
+        """
+        Return the number of frames in the channel.
+
+        Returns
+        -------
+        int
+            The number of frames.
+        """
+        return self.shape[0]
+
+    def __getitem__(self, index: int) -> npt.NDArray:
+        """
+        Convert and return a single frame.
+
+        Parameters
+        ----------
+        index : int
+            Index of the frame to convert; negative indices are supported.
+
+        Returns
+        -------
+        npt.NDArray
+            The frame heightmap as a (y_pixels, x_pixels) float32 array in nanometres.
+        """
+        num_frames, y_pixels, x_pixels = self.shape
+        if index < 0:
+            index += num_frames
+        if not 0 <= index < num_frames:
+            raise IndexError(f"frame index {index} out of range for {num_frames} frames")
+        levels = np.frombuffer(
+            self._mapped_file,
+            dtype="<i2",
+            count=x_pixels * y_pixels,
+            offset=self._data_offset + index * self._frame_stride + self._frame_header_length,
+        ).reshape((y_pixels, x_pixels))
+        return self._converter.level_to_voltage(levels)
+
+    def close(self) -> None:
+        """Release the underlying memory map."""
+        self._mapped_file.close()
+
+    def __enter__(self) -> LazyFrames:
+        """
+        Enter the context manager.
+
+        Returns
+        -------
+        LazyFrames
+            The view itself.
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Release the memory map on leaving the context.
+
+        Parameters
+        ----------
+        *args : object
+            Exception type, value and traceback, ignored.
+        """
+        self.close()
+
+
+def load_asd(file_path: Path, channel: str, lazy: bool = False, parse_colormap: bool = False):
     """
     Load a .asd file.
 
@@ -185,12 +397,20 @@ def load_asd(file_path: Path, channel: str):
     channel : str
         Channel to load. Note that only three channels seem to be present in a single .asd file. Options: TP
         (Topograph), ER (Error) and PH (Phase).
+    lazy : bool
+        If True, return a LazyFrames view instead of materialising all frames in memory. Frames are then
+        converted on access, keeping memory usage constant regardless of movie length. Default is False
+        (eager loading).
+    parse_colormap : bool
+        Whether to decode the RGB colour map anchor points of file version 2 headers; they are only of use
+        for visualisation so are skipped by default.
 
     Returns
     -------
-    npt.NDArray
-        The .asd file frames data as a numpy 3D array N x W x H
-        (Number of frames x Width of each frame x height of each frame).
+    npt.NDArray | LazyFrames
+        The .asd file frames data as a numpy float32 3D array N x W x H
+        (Number of frames x Width of each frame x height of each frame), or a LazyFrames view of the same
+        data when ``lazy`` is True.
     float
         The number of nanometres per pixel for the .asd file. (AKA the resolution).
         Enables converting between pixels and nanometres when working with the data, in order to use real-world length
@@ -202,77 +422,144 @@ def load_asd(file_path: Path, channel: str):
     """
     # Ensure the file path is a Path object
     file_path = Path(file_path)
-    # Open the file in binary mode
+    # Open the file in binary mode and memory-map it; header fields and frame data are then decoded from the
+    # mapping without copying the file through many small read calls. mmap objects support the same read and
+    # seek interface as regular binary files.
     with Path.open(file_path, "rb", encoding=None) as open_file:  # pylint: disable=unspecified-encoding
-        file_version = read_file_version(open_file)
+        if lazy:
+            # The LazyFrames view owns the mapping and keeps it open; the mapping outlives the file
+            # handle. Ownership only transfers on success - close the mapping before propagating
+            # errors (unknown file version, channel not in file) so it cannot leak.
+            mapped_file = mmap.mmap(open_file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                return _load_asd_mapped(mapped_file, channel, lazy=True, parse_colormap=parse_colormap)
+            except Exception:
+                mapped_file.close()
+                raise
+        with mmap.mmap(open_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            return _load_asd_mapped(mapped_file, channel, parse_colormap=parse_colormap)
+
+
+def _load_asd_mapped(open_file: mmap.mmap, channel: str, lazy: bool = False, parse_colormap: bool = False) -> tuple:
+    """
+    Decode a memory-mapped .asd file.
 
-        if file_version == 0:
-            header_dict = read_header_file_version_0(open_file)
+    Parameters
+    ----------
+    open_file : mmap.mmap
+        A read-only memory map of a .asd file.
+    channel : str
+        Channel to load.
+    lazy : bool
+        If True, return a LazyFrames view over the mapping (which the view then owns) instead of
+        materialising all frames.
+    parse_colormap : bool
+        Whether to decode the RGB colour map anchor points of file version 2 headers.
 
-        elif file_version == 1:
-            header_dict = read_header_file_version_1(open_file)
+    Returns
+    -------
+    tuple
+        The frames (or LazyFrames view), pixel to nanometre scaling factor and header metadata dictionary.
+    """
+    file_version = read_file_version(open_file)
 
-        elif file_version == 2:
-            header_dict = read_header_file_version_2(open_file)
-        else:
-            raise ValueError(
-                f"File version {file_version} unknown. Please add support if you "
-                "know how to decode this file version."
-            )
-        logger.debug(f"header dict: \n{header_dict}")
-
-        pixel_to_nanometre_scaling_factor_x = header_dict["x_nm"] / header_dict["x_pixels"]
-        pixel_to_nanometre_scaling_factor_y = header_dict["y_nm"] / header_dict["y_pixels"]
-        if pixel_to_nanometre_scaling_factor_x != pixel_to_nanometre_scaling_factor_y:
-            logger.warning(
-                f"Resolution of image is different in x and y directions:"
-                f"x: {pixel_to_nanometre_scaling_factor_x}"
-                f"y: {pixel_to_nanometre_scaling_factor_y}"
-            )
-        pixel_to_nanometre_scaling_factor = pixel_to_nanometre_scaling_factor_x
-
-        if channel == header_dict["channel1"]:
-            logger.info(f"Requested channel {channel} matches first channel in file: {header_dict['channel1']}")
-        elif channel == header_dict["channel2"]:
-            logger.info(f"Requested channel {channel} matches second channel in file: " f"{header_dict['channel2']}")
-
-            # Skip first channel data
-            _size_of_frame_header = header_dict["frame_header_length"]
-            # Remember that each value is two bytes (since signed int16)
-            size_of_single_frame_plus_header = (
-                header_dict["frame_header_length"] + header_dict["x_pixels"] * header_dict["y_pixels"] * 2
-            )
-            length_of_all_first_channel_frames = header_dict["num_frames"] * size_of_single_frame_plus_header
-            _ = open_file.read(length_of_all_first_channel_frames)
-        else:
-            raise ValueError(
-                f"Channel {channel} not found in this file's available channels: "
-                f"{header_dict['channel1']}, {header_dict['channel2']}"
-            )
-
-        scaling_factor = calculate_scaling_factor(
-            channel=channel,
-            z_piezo_gain=header_dict["z_piezo_gain"],
-            z_piezo_extension=header_dict["z_piezo_extension"],
-            scanner_sensitivity=header_dict["scanner_sensitivity"],
-            phase_sensitivity=header_dict["phase_sensitivity"],
+    try:
+        reader = _HEADER_READERS[file_version]
+    except KeyError as e:
+        raise ValueError(
+            f"File version {file_version} unknown. Please add support if you "
+            "know how to decode this file version."
+        ) from e
+    # Only the version 2 header carries colour map anchor points
+    header_dict = reader(open_file, parse_colormap=parse_colormap) if file_version == 2 else reader(open_file)
+    logger.debug(f"header dict: \n{header_dict}")
+
+    pixel_to_nanometre_scaling_factor_x = header_dict["x_nm"] / header_dict["x_pixels"]
+    pixel_to_nanometre_scaling_factor_y = header_dict["y_nm"] / header_dict["y_pixels"]
+    if pixel_to_nanometre_scaling_factor_x != pixel_to_nanometre_scaling_factor_y:
+        logger.warning(
+            f"Resolution of image is different in x and y directions:"
+            f"x: {pixel_to_nanometre_scaling_factor_x}"
+            f"y: {pixel_to_nanometre_scaling_factor_y}"
         )
-
-        analogue_digital_converter = create_analogue_digital_converter(
-            analogue_digital_range=header_dict["analogue_digital_range"],
-            scaling_factor=scaling_factor,
+    pixel_to_nanometre_scaling_factor = pixel_to_nanometre_scaling_factor_x
+
+    _seek_to_channel(open_file, header_dict, channel)
+
+    scaling_factor = calculate_scaling_factor(
+        channel=channel,
+        z_piezo_gain=header_dict["z_piezo_gain"],
+        z_piezo_extension=header_dict["z_piezo_extension"],
+        scanner_sensitivity=header_dict["scanner_sensitivity"],
+        phase_sensitivity=header_dict["phase_sensitivity"],
+    )
+
+    analogue_digital_converter = create_analogue_digital_converter(
+        analogue_digital_range=header_dict["analogue_digital_range"],
+        scaling_factor=scaling_factor,
+        resolution=header_dict["analogue_digital_resolution"],
+    )
+    if lazy:
+        frames = LazyFrames(
+            mapped_file=open_file,
+            data_offset=open_file.tell(),
+            num_frames=header_dict["num_frames"],
+            x_pixels=header_dict["x_pixels"],
+            y_pixels=header_dict["y_pixels"],
+            analogue_digital_converter=analogue_digital_converter,
+            frame_header_length=header_dict["frame_header_length"],
         )
-        frames = read_channel_data(
+    else:
+        frames, frame_headers = read_channel_data(
             open_file=open_file,
             num_frames=header_dict["num_frames"],
             x_pixels=header_dict["x_pixels"],
             y_pixels=header_dict["y_pixels"],
             analogue_digital_converter=analogue_digital_converter,
+            frame_header_length=header_dict["frame_header_length"],
         )
+        # Per-frame headers as a structured array; e.g. header_dict["frame_headers"]["min_data"].min() is a
+        # vectorised reduction over all frames
+        header_dict["frame_headers"] = frame_headers
+
+    return frames, pixel_to_nanometre_scaling_factor, header_dict
+
+
+def _seek_to_channel(open_file: mmap.mmap, header_dict: dict, channel: str) -> None:
+    """
+    Position the mapping at the start of the requested channel's frame data.
 
-        frames = np.array(frames)
+    Parameters
+    ----------
+    open_file : mmap.mmap
+        A read-only memory map of a .asd file, positioned just after the file header.
+    header_dict : dict
+        Metadata decoded from the file header.
+    channel : str
+        Channel to locate.
 
-        return frames, pixel_to_nanometre_scaling_factor, header_dict
+    Raises
+    ------
+    ValueError
+        If the channel is not present in the file.
+    """
+    if channel == header_dict["channel1"]:
+        logger.info(f"Requested channel {channel} matches first channel in file: {header_dict['channel1']}")
+    elif channel == header_dict["channel2"]:
+        logger.info(f"Requested channel {channel} matches second channel in file: " f"{header_dict['channel2']}")
+
+        # Skip first channel data. Remember that each value is two bytes (since signed int16)
+        size_of_single_frame_plus_header = (
+            header_dict["frame_header_length"] + header_dict["x_pixels"] * header_dict["y_pixels"] * 2
+        )
+        length_of_all_first_channel_frames = header_dict["num_frames"] * size_of_single_frame_plus_header
+        # Seek past the first channel rather than reading it into memory only to discard it
+        open_file.seek(length_of_all_first_channel_frames, os.SEEK_CUR)
+    else:
+        raise ValueError(
+            f"Channel {channel} not found in this file's available channels: "
+            f"{header_dict['channel1']}, {header_dict['channel2']}"
+        )
 
 
 def read_file_version(open_file: BinaryIO) -> int:
@@ -296,11 +583,14 @@ def read_file_version(open_file: BinaryIO) -> int:
     return file_version
 
 
-# pylint: disable=too-many-statements
+
 def read_header_file_version_0(open_file: BinaryIO) -> dict:
     """
     Read the header metadata for a .asd file using file version 0.
 
+    The fixed-layout portion of the header is read and decoded in a single call; only the variable-length
+    user name and comment need separate reads.
+
     Parameters
     ----------
     open_file : BinaryIO
@@ -311,73 +601,13 @@ def read_header_file_version_0(open_file: BinaryIO) -> dict:
     dict
         Dictionary of metadata decoded from the file header.
     """
-    header_dict = {}
-
-    # There only ever seem to be two channels available
-    # Channel encoding are all in LITTLE ENDIAN format.
-    # topology: 0x5054 decodes to 'TP' in ascii little endian
-    # error: 0x5245 decodes to 'ER' in ascii little endian
-    # phase: 0x4850 decodes to 'PH' in ascii little endian
-    header_dict["channel1"] = read_ascii(open_file, 2)
-    header_dict["channel2"] = read_ascii(open_file, 2)
-    # length of file metadata header in bytes - so we can skip it to get to the data
-    header_dict["header_length"] = read_int32(open_file)
-    # Frame header is the length of the header for each frame to be skipped
-    # before reading frame data.
-    header_dict["frame_header_length"] = read_int32(open_file)
-    # Length in bytes of the name given in the file
-    header_dict["user_name_size"] = read_int32(open_file)
-    header_dict["comment_offset_size"] = read_int32(open_file)
-    # Length in bytes of the comment for the file
-    header_dict["comment_size"] = read_int32(open_file)
-    # x and y resolution (pixels)
-    header_dict["x_pixels"] = read_int16(open_file)
-    header_dict["y_pixels"] = read_int16(open_file)
-    # x and y resolution (nm)
-    header_dict["x_nm"] = read_int16(open_file)
-    header_dict["y_nm"] = read_int16(open_file)
-    # frame time
-    header_dict["frame_time"] = read_float(open_file)
-    # z piezo extension
-    header_dict["z_piezo_extension"] = read_float(open_file)
-    # z piezo gain
-    header_dict["z_piezo_gain"] = read_float(open_file)
-    # Range of analogue voltage values (for conversion to digital)
-    header_dict["analogue_digital_range"] = read_hex_u32(open_file)
-    # Number of bits of data for analogue voltage values (for conversion to digital)
-    # aka the resolution of the instrument. Usually 12 bits, so 4096 sensitivity levels
-    header_dict["analogue_digital_data_bits_size"] = read_int32(open_file)
-    header_dict["analogue_digital_resolution"] = 2 ^ header_dict["analogue_digital_data_bits_size"]
-    # Not sure, something to do with data averaging
-    header_dict["is_averaged"] = read_bool(open_file)
-    # Window for averaging the data
-    header_dict["averaging_window"] = read_int32(open_file)
-    # Some padding to ensure backwards compatilibilty I think
-    _ = read_int16(open_file)
-    # Date of creation
-    header_dict["year"] = read_int16(open_file)
-    header_dict["month"] = read_uint8(open_file)
-    header_dict["day"] = read_uint8(open_file)
-    header_dict["hour"] = read_uint8(open_file)
-    header_dict["minute"] = read_uint8(open_file)
-    header_dict["second"] = read_uint8(open_file)
-    # Rounding degree?
-    header_dict["rounding_degree"] = read_uint8(open_file)
-    # Maximum x and y scanning range in real space, nm
-    header_dict["max_x_scan_range"] = read_float(open_file)
-    header_dict["max_y_scan_range"] = read_float(open_file)
-    # No idea
-    _ = read_int32(open_file)
-    _ = read_int32(open_file)
-    _ = read_int32(open_file)
-    # Number of frames the file had when recorded
-    header_dict["initial_frames"] = read_int32(open_file)
-    # Actual number of frames
-    header_dict["num_frames"] = read_int32(open_file)
-    # ID of the AFM instrument
-    header_dict["afm_id"] = read_int32(open_file)
-    # ID of the file
-    header_dict["file_id"] = read_int16(open_file)
+    header_dict = dict(zip(_HEADER_V0_NAMES, _HEADER_V0.unpack(open_file.read(_HEADER_V0.size))))
+    # Channel identifiers are raw ascii bytes
+    header_dict["channel1"] = header_dict["channel1"].decode("ascii")
+    header_dict["channel2"] = header_dict["channel2"].decode("ascii")
+    # The analogue to digital range is kept as the raw integer encoding; converters and the
+    # _AD_RANGE_TABLE lookup compare against integer keys so no hex string formatting is needed
+    header_dict["analogue_digital_resolution"] = 1 << header_dict["analogue_digital_data_bits_size"]
     # Name of the user
     header_dict["user_name"] = read_null_separated_utf8(open_file, length_bytes=header_dict["user_name_size"])
     # Sensitivity of the scanner in nm / V
@@ -388,20 +618,57 @@ def read_header_file_version_0(open_file: BinaryIO) -> dict:
     header_dict["scan_direction"] = read_int32(open_file)
     # Skip bytes: comment offset size
     _ = skip_bytes(open_file, header_dict["comment_offset_size"])
-    # Read a comment
-    comment = []
-    for _ in range(header_dict["comment_size"]):
-        comment.append(chr(read_int8(open_file)))
-    header_dict["comment_without_null"] = "".join([c for c in comment if c != "\x00"])
+    # Read a comment in a single read, stripping the null bytes at C level
+    raw_comment = open_file.read(header_dict["comment_size"])
+    header_dict["comment_without_null"] = raw_comment.replace(b"\x00", b"").decode("utf-8", errors="replace")
+
+    return header_dict
+
+
+
+def _read_header_v1_v2_common(open_file: BinaryIO) -> dict:
+    """
+    Read the header fields shared between .asd file versions 1 and 2.
+
+    The fixed-layout portion of the header is read and decoded in a single call; only the variable-length
+    user name and comment need separate reads.
+
+    Parameters
+    ----------
+    open_file : BinaryIO
+        An open binary file object for a .asd file.
+
+    Returns
+    -------
+    dict
+        Dictionary of metadata decoded from the shared portion of the file header.
+    """
+    header_dict = dict(zip(_HEADER_V1_V2_NAMES, _HEADER_V1_V2.unpack(open_file.read(_HEADER_V1_V2.size))))
+    # Channel identifiers are ascii characters separated by null bytes
+    header_dict["channel1"] = header_dict["channel1"].replace(b"\x00", b"").decode("ascii")
+    header_dict["channel2"] = header_dict["channel2"].replace(b"\x00", b"").decode("ascii")
+    # The analogue to digital range is kept as the raw integer encoding; converters and the
+    # _AD_RANGE_TABLE lookup compare against integer keys so no hex string formatting is needed
+    header_dict["analogue_digital_resolution"] = 1 << header_dict["analogue_digital_data_bits_size"]
+
+    # Read the user name in a single read, stripping the null bytes at C level
+    raw_user_name = open_file.read(header_dict["user_name_size"])
+    header_dict["user_name"] = raw_user_name.replace(b"\x00", b"").decode("utf-8", errors="replace")
+
+    # Read a comment in a single read, stripping the null bytes at C level
+    raw_comment = open_file.read(header_dict["comment_size"])
+    header_dict["comment_without_null"] = raw_comment.replace(b"\x00", b"").decode("utf-8", errors="replace")
 
     return header_dict
 
 
-# pylint: disable=too-many-statements
 def read_header_file_version_1(open_file: BinaryIO):
     """
     Read the header metadata for a .asd file using file version 1.
 
+    The fixed-layout portion of the header is read and decoded in a single call; only the variable-length
+    user name and comment need separate reads.
+
     Parameters
     ----------
     open_file : BinaryIO
@@ -412,199 +679,32 @@ def read_header_file_version_1(open_file: BinaryIO):
     dict
         Dictionary of metadata decoded from the file header.
     """
-    header_dict = {}
-
-    # length of file metadata header in bytes - so we can skip it to get to the data
-    header_dict["header_length"] = read_int32(open_file)
-    # Frame header is the length of the header for each frame to be skipped before
-    # reading frame data.
-    header_dict["frame_header_length"] = read_int32(open_file)
-    # Encoding for strings
-    header_dict["text_encoding"] = read_int32(open_file)
-    # Length in bytes of the name given in the file
-    header_dict["user_name_size"] = read_int32(open_file)
-    # Length in bytes of the comment for the file
-    header_dict["comment_size"] = read_int32(open_file)
-    # There only ever seem to be two channels available
-    # Channel encoding are all in LITTLE ENDIAN format.
-    # topology: 0x5054 decodes to 'TP' in ascii little endian
-    # error: 0x5245 decodes to 'ER' in ascii little endian
-    # phase: 0x4850 decodes to 'PH' in ascii little endian
-    header_dict["channel1"] = read_null_separated_utf8(open_file, length_bytes=4)
-    header_dict["channel2"] = read_null_separated_utf8(open_file, length_bytes=4)
-    # Number of frames the file had when recorded
-    header_dict["initial_frames"] = read_int32(open_file)
-    # Actual number of frames
-    header_dict["num_frames"] = read_int32(open_file)
-    # Direction of the scan
-    header_dict["scan_direction"] = read_int32(open_file)
-    # ID of the file
-    header_dict["file_id"] = read_int32(open_file)
-    # x and y resolution (pixels)
-    header_dict["x_pixels"] = read_int32(open_file)
-    header_dict["y_pixels"] = read_int32(open_file)
-    # x and y resolution (nm)
-    header_dict["x_nm"] = read_int32(open_file)
-    header_dict["y_nm"] = read_int32(open_file)
-    # Not sure, something to do with data averaging
-    header_dict["is_averaged"] = read_bool(open_file)
-    # Window for averaging the data
-    header_dict["averaging_window"] = read_int32(open_file)
-    # Date of creation
-    header_dict["year"] = read_int32(open_file)
-    header_dict["month"] = read_int32(open_file)
-    header_dict["day"] = read_int32(open_file)
-    header_dict["hour"] = read_int32(open_file)
-    header_dict["minute"] = read_int32(open_file)
-    header_dict["second"] = read_int32(open_file)
-    # Rounding degree?
-    header_dict["x_rounding_degree"] = read_int32(open_file)
-    header_dict["y_rounding_degree"] = read_int32(open_file)
-    # frame time
-    header_dict["frame_time"] = read_float(open_file)
-    # Sensitivity of the scanner in nm / V
-    header_dict["scanner_sensitivity"] = read_float(open_file)
-    # Phase sensitivity
-    header_dict["phase_sensitivity"] = read_float(open_file)
-    # Offset?
-    header_dict["offset"] = read_int32(open_file)
-    # Ignore 12 bytes
-    _ = skip_bytes(open_file, 12)
-    # ID of the AFM instrument
-    header_dict["afm_id"] = read_int32(open_file)
-    # Range of analogue voltage values (for conversion to digital)
-    header_dict["analogue_digital_range"] = read_hex_u32(open_file)
-    # Number of bits of data for analogue voltage values (for conversion to digital)
-    # aka the resolution of the instrument. Usually 12 bits, so 4096 sensitivity levels
-    header_dict["analogue_digital_data_bits_size"] = read_int32(open_file)
-    header_dict["analogue_digital_resolution"] = 2 ^ header_dict["analogue_digital_data_bits_size"]
-    # Maximum x and y scanning range in real space, nm
-    header_dict["max_x_scan_range"] = read_float(open_file)
-    header_dict["max_y_scan_range"] = read_float(open_file)
-    # Piezo extensions
-    header_dict["x_piezo_extension"] = read_float(open_file)
-    header_dict["y_piezo_extension"] = read_float(open_file)
-    header_dict["z_piezo_extension"] = read_float(open_file)
-    # Piezo gain
-    header_dict["z_piezo_gain"] = read_float(open_file)
-
-    # Read the user name
-    user_name = []
-    for _ in range(header_dict["user_name_size"]):
-        user_name.append(chr(read_int8(open_file)))
-    header_dict["user_name"] = "".join([c for c in user_name if c != "\x00"])
-
-    # Read a comment
-    comment = []
-    for _ in range(header_dict["comment_size"]):
-        comment.append(chr(read_int8(open_file)))
-    header_dict["comment_without_null"] = "".join([c for c in comment if c != "\x00"])
-
-    return header_dict
+    return _read_header_v1_v2_common(open_file)
 
 
 # pylint: disable=too-many-statements
-def read_header_file_version_2(open_file: BinaryIO) -> dict:
+def read_header_file_version_2(open_file: BinaryIO, parse_colormap: bool = False) -> dict:
     """
     Read the header metadata for a .asd file using file version 2.
 
+    The fixed-layout portion of the header is shared with file version 1 and decoded in a single call;
+    version 2 appends extra fields (feed forward parameters and colour map anchor points) after the
+    variable-length user name and comment.
+
     Parameters
     ----------
     open_file : BinaryIO
         An open binary file object for a .asd file.
+    parse_colormap : bool
+        Whether to decode the RGB colour map anchor points; when False (the default) they are skipped and
+        stored as None.
 
     Returns
     -------
     dict
         Dictionary of metadata decoded from the file header.
     """
-    header_dict = {}
-
-    # length of file metadata header in bytes - so we can skip it to get to the data
-    header_dict["header_length"] = read_int32(open_file)
-    # Frame header is the length of the header for each frame to be skipped before
-    # reading frame data.
-    header_dict["frame_header_length"] = read_int32(open_file)
-    # Encoding for strings
-    header_dict["text_encoding"] = read_int32(open_file)
-    # Length in bytes of the name given in the file
-    header_dict["user_name_size"] = read_int32(open_file)
-    # Length in bytes of the comment for the file
-    header_dict["comment_size"] = read_int32(open_file)
-    # There only ever seem to be two channels available
-    # Channel encoding are all in LITTLE ENDIAN format.
-    # topology: 0x5054 decodes to 'TP' in ascii little endian
-    # error: 0x5245 decodes to 'ER' in ascii little endian
-    # phase: 0x4850 decodes to 'PH' in ascii little endian
-    header_dict["channel1"] = read_null_separated_utf8(open_file, length_bytes=4)
-    header_dict["channel2"] = read_null_separated_utf8(open_file, length_bytes=4)
-    # Number of frames the file had when recorded
-    header_dict["initial_frames"] = read_int32(open_file)
-    # Actual number of frames
-    header_dict["num_frames"] = read_int32(open_file)
-    # Direction of the scan
-    header_dict["scan_direction"] = read_int32(open_file)
-    # ID of the file
-    header_dict["file_id"] = read_int32(open_file)
-    # x and y resolution (pixels)
-    header_dict["x_pixels"] = read_int32(open_file)
-    header_dict["y_pixels"] = read_int32(open_file)
-    # x and y resolution (nm)
-    header_dict["x_nm"] = read_int32(open_file)
-    header_dict["y_nm"] = read_int32(open_file)
-    # Not sure, something to do with data averaging
-    header_dict["is_averaged"] = read_bool(open_file)
-    # Window for averaging the data
-    header_dict["averaging_window"] = read_int32(open_file)
-    # Date of creation
-    header_dict["year"] = read_int32(open_file)
-    header_dict["month"] = read_int32(open_file)
-    header_dict["day"] = read_int32(open_file)
-    header_dict["hour"] = read_int32(open_file)
-    header_dict["minute"] = read_int32(open_file)
-    header_dict["second"] = read_int32(open_file)
-    # Rounding degree?
-    header_dict["x_rounding_degree"] = read_int32(open_file)
-    header_dict["y_rounding_degree"] = read_int32(open_file)
-    # frame time
-    header_dict["frame_time"] = read_float(open_file)
-    # Sensitivity of the scanner in nm / V
-    header_dict["scanner_sensitivity"] = read_float(open_file)
-    # Phase sensitivity
-    header_dict["phase_sensitivity"] = read_float(open_file)
-    # Offset?
-    header_dict["offset"] = read_int32(open_file)
-    # Ignore 12 bytes
-    _ = skip_bytes(open_file, 12)
-    # ID of the AFM instrument
-    header_dict["afm_id"] = read_int32(open_file)
-    # Range of analogue voltage values (for conversion to digital)
-    header_dict["analogue_digital_range"] = read_hex_u32(open_file)
-    # Number of bits of data for analogue voltage values (for conversion to digital)
-    # aka the resolution of the instrument. Usually 12 bits, so 4096 sensitivity levels
-    header_dict["analogue_digital_data_bits_size"] = read_int32(open_file)
-    header_dict["analogue_digital_resolution"] = 2 ^ header_dict["analogue_digital_data_bits_size"]
-    # Maximum x and y scanning range in real space, nm
-    header_dict["max_x_scan_range"] = read_float(open_file)
-    header_dict["max_y_scan_range"] = read_float(open_file)
-    # Piezo extensions
-    header_dict["x_piezo_extension"] = read_float(open_file)
-    header_dict["y_piezo_extension"] = read_float(open_file)
-    header_dict["z_piezo_extension"] = read_float(open_file)
-    # Piezo gain
-    header_dict["z_piezo_gain"] = read_float(open_file)
-
-    # Read the user name
-    user_name = []
-    for _ in range(header_dict["user_name_size"]):
-        user_name.append(chr(read_int8(open_file)))
-    header_dict["user_name"] = "".join([c for c in user_name if c != "\x00"])
-
-    # Read a comment
-    comment = []
-    for _ in range(header_dict["comment_size"]):
-        comment.append(chr(read_int8(open_file)))
-    header_dict["comment_without_null"] = "".join([c for c in comment if c != "\x00"])
+    header_dict = _read_header_v1_v2_common(open_file)
 
     # No idea why this file type has the number of frames again. Storing it just in case.
     header_dict["number_of_frames"] = read_int32(open_file)
@@ -619,39 +719,80 @@ def read_header_file_version_2(open_file: BinaryIO) -> dict:
     header_dict["length_red_anchor_points"] = read_int32(open_file)
     header_dict["length_green_anchor_points"] = read_int32(open_file)
     header_dict["length_blue_anchor_points"] = read_int32(open_file)
-    # Coords of anchor points
-    # Red
-    coords_red = []
-    for _ in range(header_dict["length_red_anchor_points"]):
-        anchor_x = read_int32(open_file)
-        anchor_y = read_int32(open_file)
-        coords_red.append((anchor_x, anchor_y))
-    # Green
-    coords_green = []
-    for _ in range(header_dict["length_green_anchor_points"]):
-        anchor_x = read_int32(open_file)
-        anchor_y = read_int32(open_file)
-        coords_green.append((anchor_x, anchor_y))
-    # Blue
-    coords_blue = []
-    for _ in range(header_dict["length_blue_anchor_points"]):
-        anchor_x = read_int32(open_file)
-        anchor_y = read_int32(open_file)
-        coords_blue.append((anchor_x, anchor_y))
+    # Coords of anchor points, decoded as (N, 2) arrays of (x, y) int32 pairs in a single read per colour.
+    # The anchor points are only of use for visualisation, so batch loading skips them by default.
+    for colour in ("red", "green", "blue"):
+        num_anchor_points = header_dict[f"length_{colour}_anchor_points"]
+        if parse_colormap:
+            header_dict[f"{colour}_anchor_points"] = np.frombuffer(
+                open_file.read(num_anchor_points * 8), dtype="<i4"
+            ).reshape(-1, 2)
+        else:
+            open_file.seek(num_anchor_points * 8, os.SEEK_CUR)
+            header_dict[f"{colour}_anchor_points"] = None
 
     return header_dict
 
 
+# Dispatch table mapping file versions to their header readers; adding support for a new version only
+# requires registering its reader here.
+_HEADER_READERS = {
+    0: read_header_file_version_0,
+    1: read_header_file_version_1,
+    2: read_header_file_version_2,
+}
+
+
+
+def read_frame_headers(channel_data, channel_offset: int, num_frames: int, frame_stride: int) -> npt.NDArray:
+    """
+    Decode the headers of all frames of a channel into a structured array.
+
+    Storing the headers as a structure-of-arrays means reductions such as ``headers["min_data"].min()`` are
+    vectorised over all frames rather than requiring a Python loop over per-frame dictionaries.
+
+    Parameters
+    ----------
+    channel_data : bytes | mmap.mmap
+        Buffer holding the channel region (interleaved frame headers and pixel data).
+    channel_offset : int
+        Byte offset of the start of the channel region within the buffer.
+    num_frames : int
+        The number of frames in the channel.
+    frame_stride : int
+        Byte stride between consecutive frames (frame header plus pixel data).
+
+    Returns
+    -------
+    npt.NDArray
+        Structured array of length num_frames with the fields frame_number, max_data, min_data, x_offset,
+        y_offset, x_tilt, y_tilt and is_stimulated.
+    """
+    # A dtype whose itemsize equals the frame stride decodes every header in place, striding over the
+    # interleaved pixel data; the result is then repacked into a compact copy independent of the buffer.
+    strided_dtype = np.dtype({**_FRAME_HEADER_FIELDS, "itemsize": frame_stride})
+    strided_headers = np.frombuffer(channel_data, dtype=strided_dtype, count=num_frames, offset=channel_offset)
+    frame_headers = np.empty(num_frames, dtype=np.dtype(_FRAME_HEADER_FIELDS))
+    for name in frame_headers.dtype.names:
+        frame_headers[name] = strided_headers[name]
+    return frame_headers
+
+
 def read_channel_data(
     open_file: BinaryIO,
     num_frames: int,
     x_pixels: int,
     y_pixels: int,
     analogue_digital_converter: VoltageLevelConverter,
-) -> npt.NDArray:
+    *,
+    frame_header_length: int = _FRAME_HEADER.size,
+) -> tuple[npt.NDArray, npt.NDArray]:
     """
     Read frame data from an open .asd file, starting at the current position.
 
+    The whole channel region (interleaved frame headers and pixel data) is read in a single call and decoded with
+    NumPy, so the analogue to digital conversion is applied once over all frames rather than frame-by-frame.
+
     Parameters
     ----------
     open_file : BinaryIO
@@ -664,51 +805,76 @@ def read_channel_data(
         The height of each frame in pixels.
     analogue_digital_converter : VoltageLevelConverter
         A VoltageLevelConverter instance for converting the raw level values to real world nanometre vertical heights.
+    frame_header_length : int
+        Length in bytes of the header that precedes each frame's pixel data, from the file header metadata.
 
     Returns
     -------
-    np.ndarray
-        The extracted frame heightmap data as a N x W x H 3D numpy array
-        (number of frames x width of each frame x height of each frame). Units are nanometres.
+    tuple[npt.NDArray, npt.NDArray]
+        The extracted frame heightmap data as a N x W x H 3D numpy float32 array, preallocated and filled
+        in place (number of frames x width of each frame x height of each frame), units are nanometres,
+        and a structured array of the per-frame headers (see read_frame_headers).
     """
-    # List to store the frames as numpy arrays
-    frames = []
-    # Dictionary to store all the variables together in case we want to return them.
-    # Very useful for debugging!
-    frame_header_dict = {}
-
-    for _ in range(num_frames):
-        frame_header_dict["frame_number"] = read_int32(open_file)
-        frame_header_dict["max_data"] = read_int16(open_file)
-        frame_header_dict["min_data"] = read_int16(open_file)
-        frame_header_dict["x_offset"] = read_int16(open_file)
-        frame_header_dict["y_offset"] = read_int16(open_file)
-        frame_header_dict["x_tilt"] = read_float(open_file)
-        frame_header_dict["y_tilt"] = read_float(open_file)
-        frame_header_dict["is_stimulated"] = read_bool(open_file)
-        _booked_1 = read_int8(open_file)
-        _booked_2 = read_int16(open_file)
-        _booked_3 = read_int32(open_file)
-        _booked_4 = read_int32(open_file)
-
-        frame_header_dict["total_size"] = x_pixels * y_pixels
-        # Read frame byte data. Data is always stored as signed 2 byte integer form
-        # so multiply the size of the array by 2
-        frame_header_dict["total_byte_size"] = frame_header_dict["total_size"] * 2
-        frame_data = open_file.read(frame_header_dict["total_size"] * 2)
-        # Decode frame data from bytes. Data is always stored in signed 2 byte integer form
-        frame_data = np.frombuffer(frame_data, dtype=np.int16)
-        # Convert from Voltage to Real units
-        frame_data = analogue_digital_converter.level_to_voltage(frame_data)
-        # Reshape frame to 2D array
-        frame_data = frame_data.reshape((y_pixels, x_pixels))
-        frames.append(frame_data)
-
-    return frames
+    # Each value is stored as a signed 2 byte integer, so each frame occupies its header plus 2 bytes per pixel.
+    frame_byte_size = x_pixels * y_pixels * 2
+    frame_stride = frame_header_length + frame_byte_size
+    channel_byte_size = num_frames * frame_stride
+    if isinstance(open_file, mmap.mmap):
+        # View the channel region directly over the memory map - no copy between kernel and user space
+        channel_data = open_file
+        channel_offset = open_file.tell()
+        open_file.seek(channel_byte_size, os.SEEK_CUR)
+    else:
+        # Read the entire channel region in one go rather than a read per frame
+        channel_data = open_file.read(channel_byte_size)
+        channel_offset = 0
+    raw_bytes = np.frombuffer(channel_data, dtype=np.uint8, count=channel_byte_size, offset=channel_offset).reshape(
+        (num_frames, frame_stride)
+    )
+
+    # Decode all frame headers in one vectorised pass into a structure-of-arrays
+    frame_headers = read_frame_headers(channel_data, channel_offset, num_frames, frame_stride)
+    # View the pixel data of all frames as a single (N x H x W) signed 16 bit integer cube, skipping the
+    # frame headers. The last axis is contiguous so no copy is made.
+    pixels = raw_bytes[:, frame_header_length:].view("<i2").reshape((num_frames, y_pixels, x_pixels))
+    # Convert from Voltage to Real units in one pass over all frames, with a compiled parallel kernel when
+    # numba is available.
+    if numba is not None:
+        frames = _level_to_voltage_jit(
+            np.ascontiguousarray(pixels),
+            analogue_digital_converter._a,  # pylint: disable=protected-access
+            analogue_digital_converter._b,  # pylint: disable=protected-access
+        )
+        return frames, frame_headers
+    # Preallocate the output cube and convert into it in place, avoiding any intermediate copies
+    frames = np.empty((num_frames, y_pixels, x_pixels), dtype=np.float32)
+    np.multiply(pixels, analogue_digital_converter._a, out=frames)  # pylint: disable=protected-access
+    frames += analogue_digital_converter._b  # pylint: disable=protected-access
+    return frames, frame_headers
+
+
+# Analogue to digital conversion range encoding, mapping the raw header value to the converter class,
+# the voltage range magnitude and the (min, max) voltage mapping:
+# unipolar_1_00V : 0x00000001 +0.00 to +1.00 V
+# unipolar_2_50V : 0x00000002 +0.00 to +2.50 V
+# unipolar_9.99v : 0x00000003 +0.00 to +9.99 V
+# unipolar_5_00V : 0x00000004 +0.00 to +5.00 V
+# bipolar_1_00V  : 0x00010000 -1.00 to +1.00 V
+# bipolar_2_50V  : 0x00020000 -2.50 to +2.50 V
+# bipolar_5_00V  : 0x00040000 -5.00 to +5.00 V
+_AD_RANGE_TABLE: dict[int, tuple[type[VoltageLevelConverter], float, tuple[float, float]]] = {
+    0x00000001: (UnipolarConverter, 1.0, (0.0, 1.0)),
+    0x00000002: (UnipolarConverter, 2.5, (0.0, 2.5)),
+    0x00000003: (UnipolarConverter, 9.99, (0.0, 9.99)),
+    0x00000004: (UnipolarConverter, 5.0, (0.0, 5.0)),
+    0x00010000: (BipolarConverter, 1.0, (-1.0, 1.0)),
+    0x00020000: (BipolarConverter, 2.5, (-2.5, 2.5)),
+    0x00040000: (BipolarConverter, 5.0, (-5.0, 5.0)),
+}
 
 
 def create_analogue_digital_converter(
-    analogue_digital_range: float, scaling_factor: float, resolution: int = 4096
+    analogue_digital_range: float | int | str, scaling_factor: float, resolution: int
 ) -> VoltageLevelConverter:
     """
     Create an analogue to digital converter for a given range, scaling factor and resolution.
@@ -717,8 +883,9 @@ def create_analogue_digital_converter(
 
     Parameters
     ----------
-    analogue_digital_range : float
-        The range of analogue voltage values.
+    analogue_digital_range : float | int | str
+        The range of analogue voltage values, either as the raw integer encoding from the file header or its
+        hexadecimal string representation.
     scaling_factor : float
         A scaling factor calculated elsewhere that scales the heightmap appropriately based on the type of channel and
         sensor parameters.
@@ -733,76 +900,18 @@ def create_analogue_digital_converter(
         which converts arbitrary level values into real world nanometre heights for the given .asd
         file. Note that this is file specific since the parameters will change between files.
     """
-    # Analogue to digital hex conversion range encoding:
-    # unipolar_1_00V : 0x00000001 +0.00 to +1.00 V
-    # unipolar_2_50V : 0x00000002 +0.00 to +2.50 V
-    # unipolar_9.99v : 0x00000003 +0.00 to +9.99 V
-    # unipolar_5_00V : 0x00000004 +0.00 to +5.00 V
-    # bipolar_1_00V  : 0x00010000 -1.00 to +1.00 V
-    # bipolar_2_50V  : 0x00020000 -2.50 to +2.50 V
-    # bipolar_5_00V  : 0x00040000 -5.00 to +5.00 V
-
-    converter: VoltageLevelConverter
-
-    if analogue_digital_range == hex(0x00000001):
-        # unipolar 1.0V
-        mapping = (0.0, 1.0)
-        converter = UnipolarConverter(
-            analogue_digital_range=1.0,
-            resolution=resolution,
-            scaling_factor=scaling_factor,
-        )
-    elif analogue_digital_range == hex(0x00000002):
-        # unipolar 2.5V
-        mapping = (0.0, 2.5)
-        converter = UnipolarConverter(
-            analogue_digital_range=2.5,
-            resolution=resolution,
-            scaling_factor=scaling_factor,
-        )
-    elif analogue_digital_range == hex(0x00000003):
-        mapping = (0, 9.99)
-        converter = UnipolarConverter(
-            analogue_digital_range=9.99,
-            resolution=resolution,
-            scaling_factor=scaling_factor,
-        )
-    elif analogue_digital_range == hex(0x00000004):
-        # unipolar 5.0V
-        mapping = (0.0, 5.0)
-        converter = UnipolarConverter(
-            analogue_digital_range=5.0,
-            resolution=resolution,
-            scaling_factor=scaling_factor,
-        )
-    elif analogue_digital_range == hex(0x00010000):
-        # bipolar 1.0V
-        mapping = (-1.0, 1.0)
-        converter = BipolarConverter(
-            analogue_digital_range=1.0,
-            resolution=resolution,
-            scaling_factor=scaling_factor,
-        )
-    elif analogue_digital_range == hex(0x00020000):
-        # bipolar 2.5V
-        mapping = (-2.5, 2.5)
-        converter = BipolarConverter(
-            analogue_digital_range=2.5,
-            resolution=resolution,
-            scaling_factor=scaling_factor,
-        )
-    elif analogue_digital_range == hex(0x00040000):
-        # bipolar 5.0V
-        mapping = (-5.0, 5.0)
-        converter = BipolarConverter(
-            analogue_digital_range=5.0,
-            resolution=resolution,
-            scaling_factor=scaling_factor,
-        )
-    else:
+    key = int(analogue_digital_range, 16) if isinstance(analogue_digital_range, str) else analogue_digital_range
+    try:
+        converter_class, voltage_range, mapping = _AD_RANGE_TABLE[key]
+    except KeyError as e:
         raise ValueError(
             f"Analogue to digital range hex value {analogue_digital_range} has no known " "analogue-digital mapping."
-        )
+        ) from e
+    converter = converter_class(
+        analogue_digital_range=voltage_range,
+        resolution=resolution,
+        scaling_factor=scaling_factor,
+    )
     logger.info(f"Analogue to digital mapping | Range: {analogue_digital_range} -> {mapping}")
     logger.info(f"Converter: {converter}")
     return converter
@@ -824,27 +933,35 @@ def create_animation(file_name: str, frames: npt.NDArray, file_format: str = ".g
     file_format : str
         Optional string for the file format to save as. Formats currently available: .mp4, .gif.
     """
+    # Import locally so that simply loading .asd data does not pay the several hundred millisecond cost of
+    # importing matplotlib
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+    from matplotlib import animation  # pylint: disable=import-outside-toplevel
+
     fig, axis = plt.subplots()
+    # Create a single image artist and update its data per frame rather than stacking a fresh
+    # AxesImage on the axis for every frame, which accumulates artists and slows rendering.
+    image = axis.imshow(frames[0], animated=True)
 
-    def update(frame: npt.NDArray):
+    def update(frame_index: int):
         """
         Update the image with the latest frame.
 
         Parameters
         ----------
-        frame : npt.NDArray
-            Single frame to add to the image.
+        frame_index : int
+            Index of the frame to draw.
 
         Returns
         -------
-        axis
-            Matplotlib axis.
+        tuple
+            Tuple of the artists that changed, as required for blitting.
         """
-        axis.imshow(frames[frame])
-        return axis
+        image.set_data(frames[frame_index])
+        return (image,)
 
     # Create the animation object
-    ani = animation.FuncAnimation(fig, update, frames=frames.shape[0], interval=200)
+    ani = animation.FuncAnimation(fig, update, frames=range(frames.shape[0]), interval=200, blit=True)
 
     if file_format == ".mp4":
         ani.save(f"{file_name}.mp4", writer="ffmpeg")
@@ -0,0 +1,155 @@
+"""Binary layouts of the fixed-size .asd file and frame headers."""
+
+import struct
+
+# Fixed-layout portion of the file version 0 header, decoded with a single unpack. The '2x' pad skips a two
+# byte backwards-compatibility padding field and the '12x' pad skips three unknown int32 fields.
+_HEADER_V0 = struct.Struct("<2s2siiiiihhhhfffIi?i2xhBBBBBBff12xiiih")
+_HEADER_V0_NAMES = (
+    # There only ever seem to be two channels available
+    # Channel encoding are all in LITTLE ENDIAN format.
+    # topology: 0x5054 decodes to 'TP' in ascii little endian
+    # error: 0x5245 decodes to 'ER' in ascii little endian
+    # phase: 0x4850 decodes to 'PH' in ascii little endian
+    "channel1",
+    "channel2",
+    # length of file metadata header in bytes - so we can skip it to get to the data
+    "header_length",
+    # Frame header is the length of the header for each frame to be skipped
+    # before reading frame data.
+    "frame_header_length",
+    # Length in bytes of the name given in the file
+    "user_name_size",
+    "comment_offset_size",
+    # Length in bytes of the comment for the file
+    "comment_size",
+    # x and y resolution (pixels)
+    "x_pixels",
+    "y_pixels",
+    # x and y resolution (nm)
+    "x_nm",
+    "y_nm",
+    # frame time
+    "frame_time",
+    # z piezo extension and gain
+    "z_piezo_extension",
+    "z_piezo_gain",
+    # Range of analogue voltage values (for conversion to digital)
+    "analogue_digital_range",
+    # Number of bits of data for analogue voltage values (for conversion to digital)
+    # aka the resolution of the instrument. Usually 12 bits, so 4096 sensitivity levels
+    "analogue_digital_data_bits_size",
+    # Not sure, something to do with data averaging
+    "is_averaged",
+    # Window for averaging the data
+    "averaging_window",
+    # Date of creation
+    "year",
+    "month",
+    "day",
+    "hour",
+    "minute",
+    "second",
+    # Rounding degree?
+    "rounding_degree",
+    # Maximum x and y scanning range in real space, nm
+    "max_x_scan_range",
+    "max_y_scan_range",
+    # Number of frames the file had when recorded
+    "initial_frames",
+    # Actual number of frames
+    "num_frames",
+    # ID of the AFM instrument
+    "afm_id",
+    # ID of the file
+    "file_id",
+)
+
+
+# Fixed-layout portion of the file version 1 and 2 headers, decoded with a single unpack. Versions 1 and 2
+# share this layout; version 2 appends extra fields after the user name and comment. The '12x' pad skips 12
+# ignored bytes.
+_HEADER_V1_V2 = struct.Struct("<iiiii4s4siiiiiiii?iiiiiiiiifffi12xiIiffffff")
+_HEADER_V1_V2_NAMES = (
+    # length of file metadata header in bytes - so we can skip it to get to the data
+    "header_length",
+    # Frame header is the length of the header for each frame to be skipped before
+    # reading frame data.
+    "frame_header_length",
+    # Encoding for strings
+    "text_encoding",
+    # Length in bytes of the name given in the file
+    "user_name_size",
+    # Length in bytes of the comment for the file
+    "comment_size",
+    # There only ever seem to be two channels available
+    # Channel encoding are all in LITTLE ENDIAN format.
+    # topology: 0x5054 decodes to 'TP' in ascii little endian
+    # error: 0x5245 decodes to 'ER' in ascii little endian
+    # phase: 0x4850 decodes to 'PH' in ascii little endian
+    "channel1",
+    "channel2",
+    # Number of frames the file had when recorded
+    "initial_frames",
+    # Actual number of frames
+    "num_frames",
+    # Direction of the scan
+    "scan_direction",
+    # ID of the file
+    "file_id",
+    # x and y resolution (pixels)
+    "x_pixels",
+    "y_pixels",
+    # x and y resolution (nm)
+    "x_nm",
+    "y_nm",
+    # Not sure, something to do with data averaging
+    "is_averaged",
+    # Window for averaging the data
+    "averaging_window",
+    # Date of creation
+    "year",
+    "month",
+    "day",
+    "hour",
+    "minute",
+    "second",
+    # Rounding degree?
+    "x_rounding_degree",
+    "y_rounding_degree",
+    # frame time
+    "frame_time",
+    # Sensitivity of the scanner in nm / V
+    "scanner_sensitivity",
+    # Phase sensitivity
+    "phase_sensitivity",
+    # Offset?
+    "offset",
+    # ID of the AFM instrument
+    "afm_id",
+    # Range of analogue voltage values (for conversion to digital)
+    "analogue_digital_range",
+    # Number of bits of data for analogue voltage values (for conversion to digital)
+    # aka the resolution of the instrument. Usually 12 bits, so 4096 sensitivity levels
+    "analogue_digital_data_bits_size",
+    # Maximum x and y scanning range in real space, nm
+    "max_x_scan_range",
+    "max_y_scan_range",
+    # Piezo extensions
+    "x_piezo_extension",
+    "y_piezo_extension",
+    "z_piezo_extension",
+    # Piezo gain
+    "z_piezo_gain",
+)
+
+
+# Layout of the fixed-size header that precedes the pixel data of every frame:
+# frame_number, max_data, min_data, x_offset, y_offset, x_tilt, y_tilt,
+# is_stimulated followed by four reserved ("booked") fields.
+_FRAME_HEADER = struct.Struct("<ihhhhff?bhii")
+# The same layout as a NumPy structured dtype, used to decode all frame headers in one vectorised pass.
+_FRAME_HEADER_FIELDS = {
+    "names": ["frame_number", "max_data", "min_data", "x_offset", "y_offset", "x_tilt", "y_tilt", "is_stimulated"],
+    "formats": ["<i4", "<i2", "<i2", "<i2", "<i2", "<f4", "<f4", "?"],
+}
@@ -25,12 +25,9 @@ def _ibw_pixel_to_nm_scaling(scan: dict) -> float:
     float
         A value corresponding to the real length of a single pixel.
     """
-    # Get metadata
-    notes = {}
-    for line in str(scan["wave"]["note"]).split("\\r"):
-        if line.count(":"):
-            key, val = line.split(":", 1)
-            notes[key] = val.strip()
+    # Get metadata; values are left unstripped since float() ignores surrounding whitespace for
+    # the two keys that are actually consumed
+    notes = dict(line.split(":", 1) for line in str(scan["wave"]["note"]).split("\\r") if ":" in line)
     # Has potential for non-square pixels but not yet implemented
     return (
         float(notes["SlowScanSize"]) / scan["wave"]["wData"].shape[0] * 1e9,  # as in m
@@ -2,7 +2,19 @@
 
 import struct
 from typing import BinaryIO
+
 import h5py
+import numpy as np
+
+# Precompiled structs for the fixed-size readers; compiling each format once avoids re-parsing the format
+# string on every call, which matters when headers are read field by field. All formats are pinned to
+# little-endian ("<") since that is the byte order of the supported file formats, regardless of the host.
+_INT8 = struct.Struct("<b")
+_INT16 = struct.Struct("<h")
+_INT32 = struct.Struct("<i")
+_UINT32 = struct.Struct("<I")
+_FLOAT = struct.Struct("<f")
+_DOUBLE = struct.Struct("<d")
 
 
 def read_uint8(open_file: BinaryIO) -> int:
@@ -19,7 +31,8 @@ def read_uint8(open_file: BinaryIO) -> int:
     int
         Integer decoded value.
     """
-    return int.from_bytes(open_file.read(1), byteorder="little")
+    # Subscripting the single byte returns the int directly, skipping the int.from_bytes machinery
+    return open_file.read(1)[0]
 
 
 def read_int8(open_file: BinaryIO) -> int:
@@ -36,7 +49,7 @@ def read_int8(open_file: BinaryIO) -> int:
     int
         Integer decoded value.
     """
-    return struct.unpack("b", open_file.read(1))[0]
+    return _INT8.unpack(open_file.read(1))[0]
 
 
 def read_int16(open_file: BinaryIO) -> int:
@@ -53,7 +66,7 @@ def read_int16(open_file: BinaryIO) -> int:
     int
         Integer decoded value.
     """
-    return struct.unpack("h", open_file.read(2))[0]
+    return _INT16.unpack(open_file.read(2))[0]
 
 
 def read_int32(open_file: BinaryIO) -> int:
@@ -70,7 +83,7 @@ def read_int32(open_file: BinaryIO) -> int:
     int
         Integer decoded value.
     """
-    return struct.unpack("i", open_file.read(4))[0]
+    return _INT32.unpack(open_file.read(4))[0]
 
 
 def read_uint32(open_file: BinaryIO) -> int:
@@ -87,7 +100,7 @@ def read_uint32(open_file: BinaryIO) -> int:
     int
         Integer decoded value.
     """
-    return struct.unpack("<I", open_file.read(4))[0]
+    return _UINT32.unpack(open_file.read(4))[0]
 
 
 def read_hex_u32(open_file: BinaryIO) -> str:
@@ -104,7 +117,10 @@ def read_hex_u32(open_file: BinaryIO) -> str:
     str
         String representing a hexadecimal encoded integer value.
     """
-    return hex(struct.unpack("<I", open_file.read(4))[0])
+    # Reversing the little-endian bytes and hex-formatting them directly skips the intermediate
+    # Python int; stripping leading zeros keeps the output identical to hex().
+    stripped = open_file.read(4)[::-1].hex().lstrip("0")
+    return "0x" + (stripped or "0")
 
 
 def read_float(open_file: BinaryIO) -> float:
@@ -121,7 +137,7 @@ def read_float(open_file: BinaryIO) -> float:
     float
         Float decoded value.
     """
-    return struct.unpack("f", open_file.read(4))[0]
+    return _FLOAT.unpack(open_file.read(4))[0]
 
 
 def read_bool(open_file: BinaryIO) -> bool:
@@ -138,7 +154,7 @@ def read_bool(open_file: BinaryIO) -> bool:
     bool
         Boolean decoded value.
     """
-    return bool(int.from_bytes(open_file.read(1), byteorder="little"))
+    return open_file.read(1)[0] != 0
 
 
 def read_double(open_file: BinaryIO) -> float:
@@ -155,7 +171,7 @@ def read_double(open_file: BinaryIO) -> float:
     float
         Float decoded from the double value.
     """
-    return struct.unpack("d", open_file.read(8))[0]
+    return _DOUBLE.unpack(open_file.read(8))[0]
 
 
 def read_ascii(open_file: BinaryIO, length_bytes: int = 1) -> str:
@@ -218,7 +234,63 @@ def skip_bytes(open_file: BinaryIO, length_bytes: int = 1) -> bytes:
     return open_file.read(length_bytes)
 
 
-def unpack_hdf5(open_hdf5_file: h5py.File, group_path: str = "/") -> dict:
+def read_record(open_file: BinaryIO, dtype: np.dtype) -> np.void:
+    """
+    Read a fixed-layout binary record from an open binary file in a single read.
+
+    The record layout is declared as a NumPy structured dtype, so an entire header of many fields is
+    read and decoded in one call rather than one small read per field.
+
+    Parameters
+    ----------
+    open_file : BinaryIO
+        An open binary file object.
+    dtype : np.dtype
+        Structured dtype describing the record layout, e.g.
+        ``np.dtype([("magic", "<u4"), ("version", "<i2"), ("scan_size", "<f8")])``.
+
+    Returns
+    -------
+    np.void
+        The decoded record; individual fields are accessed by name, e.g. ``record["version"]``.
+    """
+    return np.frombuffer(open_file.read(dtype.itemsize), dtype=dtype)[0]
+
+
+def _pack_structured(branch: dict) -> dict | np.ndarray:
+    """
+    Pack a dictionary of equal-length 1-D arrays into a single structured array.
+
+    Sub-dictionaries are packed first; a dictionary is converted when every value is a 1-D numeric
+    array of the same length, otherwise it is returned unchanged.
+
+    Parameters
+    ----------
+    branch : dict
+        Dictionary of values unpacked from an hdf5 group.
+
+    Returns
+    -------
+    dict | np.ndarray
+        A structured array with one named field per key if the group qualifies, otherwise the
+        input dictionary with any qualifying sub-dictionaries packed.
+    """
+    for key, value in branch.items():
+        if isinstance(value, dict):
+            branch[key] = _pack_structured(value)
+    if branch and all(
+        isinstance(value, np.ndarray) and value.ndim == 1 and value.dtype != object for value in branch.values()
+    ):
+        lengths = {value.shape[0] for value in branch.values()}
+        if len(lengths) == 1:
+            structured = np.empty(lengths.pop(), dtype=[(key, value.dtype) for key, value in branch.items()])
+            for key, value in branch.items():
+                structured[key] = value
+            return structured
+    return branch
+
+
+def unpack_hdf5(open_hdf5_file: h5py.File, group_path: str = "/", pack_structured: bool = False) -> dict:
     """
     Read a dictionary from an open hdf5 file.
 
@@ -228,6 +300,10 @@ def unpack_hdf5(open_hdf5_file: h5py.File, group_path: str = "/") -> dict:
         An open hdf5 file object.
     group_path : str
         Path to the group in the hdf5 file to start reading the data from.
+    pack_structured : bool
+        If True, any group whose datasets are all 1-D numeric arrays of equal length is returned
+        as a single structured array with one named field per dataset instead of a dictionary of
+        separate arrays. The top-level return value is always a dictionary.
 
     Returns
     -------
@@ -243,16 +319,36 @@ def unpack_hdf5(open_hdf5_file: h5py.File, group_path: str = "/") -> dict:
     >>> with h5py.File("path/to/file.h5", "r") as f:
     >>>     data = unpack_hdf5(open_hdf5_file=f, group_path="/dataset_name")
     """
-    data = {}
-    for key, item in open_hdf5_file[group_path].items():
+    data: dict = {}
+
+    def _unpack(name: str, item: h5py.Group | h5py.Dataset) -> None:
+        # visititems hands back each object once with its path relative to the root group; walk the
+        # path to find (or create) the parent dict for this entry
+        *parents, key = name.split("/")
+        branch = data
+        for parent in parents:
+            branch = branch.setdefault(parent, {})
         if isinstance(item, h5py.Group):
-            # Incur recursion for nested groups
-            data[key] = unpack_hdf5(open_hdf5_file, f"{group_path}/{key}")
-        # Decode byte strings to utf-8. The data type "O" is a byte string.
-        elif isinstance(item, h5py.Dataset) and item.dtype == "O":
+            # Materialise groups eagerly so empty groups still appear as empty dicts
+            branch.setdefault(key, {})
+        # Decode byte strings to utf-8. The data type "O" is a byte string. Reading through asstr()
+        # decodes scalars and whole string arrays alike inside h5py rather than per element in Python.
+        elif item.dtype == "O":
             # Byte string
-            data[key] = item[()].decode("utf-8")
+            branch[key] = item.asstr()[()]
+        elif item.shape:
+            # Non-scalar dataset; read_direct decodes straight into the preallocated array,
+            # skipping the slower high-level __getitem__ path
+            array = np.empty(item.shape, dtype=item.dtype)
+            item.read_direct(array)
+            branch[key] = array
         else:
-            # Another type of dataset
-            data[key] = item[()]
+            # Scalar dataset
+            branch[key] = item[()]
+
+    # visititems walks the whole tree inside the HDF5 library rather than recursing group by group
+    # in Python and re-resolving concatenated paths at each level
+    open_hdf5_file[group_path].visititems(_unpack)
+    if pack_structured:
+        data = {key: _pack_structured(value) if isinstance(value, dict) else value for key, value in data.items()}
     return data
@@ -10,6 +10,52 @@ from AFMReader.logging import logger
 
 logger.enable(__package__)
 
+# Channel lists keyed by file path with the modification time stored alongside, so repeated loads
+# of different channels from the same file skip re-reading the tag table of every page. A stale
+# entry is replaced in place when the file changes on disk, and the cache is bounded by evicting
+# the oldest entry, so batch scans over many files cannot grow it without limit.
+_CHANNEL_LIST_CACHE: dict[str, tuple[float, dict[str, int]]] = {}
+_CHANNEL_LIST_CACHE_MAX_ENTRIES = 64
+
+
+def _get_channel_list(tif: tifffile.tifffile.TiffFile, file_path: Path) -> dict[str, int]:
+    """
+    Build the mapping of channel names to page indices for a .jpk file.
+
+    Results are cached per file path and modification time, so loading several channels from the
+    same file only walks the pages once.
+
+    Parameters
+    ----------
+    tif : tifffile.tifffile.TiffFile
+        An open .jpk tiff file.
+    file_path : Path
+        Path to the .jpk file, used as the cache key.
+
+    Returns
+    -------
+    dict[str, int]
+        Dictionary mapping channel names such as 'height_trace' to their page index in the file.
+    """
+    cache_key = str(file_path)
+    mtime = file_path.stat().st_mtime
+    cached = _CHANNEL_LIST_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    channel_list: dict[str, int] = {}
+    for i, page in enumerate(tif.pages[1:]):  # [0] is thumbnail
+        available_channel = page.tags["32848"].value  # keys are hexadecimal values
+        if page.tags["32849"].value == 0:  # whether img is trace or retrace
+            tr_rt = "trace"
+        else:
+            tr_rt = "retrace"
+        channel_list[f"{available_channel}_{tr_rt}"] = i + 1
+    # Replacing the path's entry also evicts any stale mtime; drop the oldest entry once full
+    if cache_key not in _CHANNEL_LIST_CACHE and len(_CHANNEL_LIST_CACHE) >= _CHANNEL_LIST_CACHE_MAX_ENTRIES:
+        _CHANNEL_LIST_CACHE.pop(next(iter(_CHANNEL_LIST_CACHE)))
+    _CHANNEL_LIST_CACHE[cache_key] = (mtime, channel_list)
+    return channel_list
+
 
 def _jpk_pixel_to_nm_scaling(tiff_page: tifffile.tifffile.TiffPage) -> float:
     """
@@ -68,21 +114,13 @@ def load_jpk(file_path: Path | str, channel: str) -> tuple[np.ndarray, float]:
     """
     logger.info(f"Loading image from : {file_path}")
     file_path = Path(file_path)
-    filename = file_path.stem
     try:
         tif = tifffile.TiffFile(file_path)
     except FileNotFoundError:
-        logger.error(f"[{filename}] File not found : {file_path}")
+        logger.error(f"[{file_path.stem}] File not found : {file_path}")
         raise
     # Obtain channel list for all channels in file
-    channel_list = {}
-    for i, page in enumerate(tif.pages[1:]):  # [0] is thumbnail
-        available_channel = page.tags["32848"].value  # keys are hexadecimal values
-        if page.tags["32849"].value == 0:  # whether img is trace or retrace
-            tr_rt = "trace"
-        else:
-            tr_rt = "retrace"
-        channel_list[f"{available_channel}_{tr_rt}"] = i + 1
+    channel_list = _get_channel_list(tif, file_path)
     try:
         channel_idx = channel_list[channel]
     except KeyError:
@@ -91,16 +129,26 @@ def load_jpk(file_path: Path | str, channel: str) -> tuple[np.ndarray, float]:
 
     # Get image and if applicable, scale it
     channel_page = tif.pages[channel_idx]
-    image = channel_page.asarray()
+    try:
+        # For uncompressed contiguous pages this is a zero-copy view into the memory-mapped file;
+        # compressed or tiled pages fall back to a regular decoded read. The scaling below always
+        # writes a fresh array, so the mapping itself is never modified.
+        image = channel_page.asarray(out="memmap")
+    except (ValueError, NotImplementedError):
+        image = channel_page.asarray()
     scaling_type = channel_page.tags["33027"].value
     if scaling_type == "LinearScaling":
         scaling = channel_page.tags["33028"].value
         offset = channel_page.tags["33029"].value
-        image = (image * scaling) + offset
+        # The multiply promotes the raw integer data to float once; the offset and the unit
+        # conversion are then applied in place rather than each allocating a full-image temporary
+        image = image * scaling
+        image += offset
+        image *= 1e9
     elif scaling_type == "NullScaling":
-        pass
+        image = image * 1e9
     else:
         raise ValueError(f"Scaling type {scaling_type} is not 'NullScaling' or 'LinearScaling'")
     # Get page for common metadata between scans
     metadata_page = tif.pages[0]
-    return (image * 1e9, _jpk_pixel_to_nm_scaling(metadata_page))
+    return (image, _jpk_pixel_to_nm_scaling(metadata_page))
@@ -4,12 +4,16 @@ import sys
 
 from loguru import logger
 
-logger.remove()
-# Set the format to have blue time, green file, module, function and line, and white message
-logger.add(
-    sys.stderr,
-    colorize=True,
-    format="<blue>{time:HH:mm:ss}</blue> | <level>{level}</level> |"
-    "<magenta>{file}</magenta>:<magenta>{module}</magenta>:<magenta>"
-    "{function}</magenta>:<magenta>{line}</magenta> | <level>{message}</level>",
-)
+# Guard the sink setup so re-executing this module (notebook reloads, multiprocessing workers)
+# does not stack a duplicate sink per import, doubling the formatting work of every log call
+if not getattr(logger, "_afmreader_configured", False):
+    logger.remove()
+    # Set the format to have blue time, green file, module, function and line, and white message
+    logger.add(
+        sys.stderr,
+        colorize=True,
+        format="<blue>{time:HH:mm:ss}</blue> | <level>{level}</level> |"
+        "<magenta>{file}</magenta>:<magenta>{module}</magenta>:<magenta>"
+        "{function}</magenta>:<magenta>{line}</magenta> | <level>{message}</level>",
+    )
+    logger._afmreader_configured = True  # pylint: disable=protected-access
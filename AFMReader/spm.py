@@ -84,7 +84,9 @@ def load_spm(file_path: Path | str, channel: str) -> tuple:
         logger.info(f"[{filename}] : Loaded image from : {file_path}")
         channel_data = scan.get_channel(channel)
         logger.info(f"[{filename}] : Extracted channel {channel}")
-        image = np.flipud(np.array(channel_data.pixels))
+        # np.asarray avoids copying when pixels is already an ndarray; the vertical flip is a
+        # strided view rather than a materialised copy
+        image = np.asarray(channel_data.pixels)[::-1]
     except FileNotFoundError:
         logger.error(f"[{filename}] File not found : {file_path}")
         raise
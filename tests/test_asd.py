@@ -3,6 +3,8 @@
 from pathlib import Path
 import pytest
 
+import numpy as np
+
 from AFMReader.asd import load_asd
 
 BASE_DIR = Path.cwd()
@@ -28,3 +30,75 @@ def test_load_asd(file_name: str, channel: str, number_of_frames: int, pixel_to_
     assert len(result_frames) == number_of_frames
     assert result_pixel_to_nm_scaling == pixel_to_nm_scaling
     assert isinstance(result_metadata, dict)
+
+
+@pytest.mark.parametrize(
+    ("file_name", "channel", "number_of_frames"),
+    [
+        pytest.param("sample_0.asd", "TP", 142, id="file type 0"),
+        pytest.param("sample_1.asd", "TP", 197, id="file type 1"),
+    ],
+)
+def test_load_asd_lazy(file_name: str, channel: str, number_of_frames: int) -> None:
+    """Test lazy loading of a .asd file matches eager loading frame for frame."""
+    file_path = RESOURCES / file_name
+    eager_frames, eager_pixel_to_nm_scaling, _ = load_asd(file_path, channel)
+    lazy_frames, lazy_pixel_to_nm_scaling, _ = load_asd(file_path, channel, lazy=True)
+
+    assert lazy_pixel_to_nm_scaling == eager_pixel_to_nm_scaling
+    assert len(lazy_frames) == number_of_frames
+    np.testing.assert_array_equal(lazy_frames[0], eager_frames[0])
+    # Negative indices are supported
+    np.testing.assert_array_equal(lazy_frames[-1], eager_frames[number_of_frames - 1])
+    with pytest.raises(IndexError):
+        _ = lazy_frames[number_of_frames]
+    # Closing the view releases the underlying memory map so frames are no longer readable
+    lazy_frames.close()
+    with pytest.raises(ValueError):  # noqa: PT011
+        _ = lazy_frames[0]
+
+
+@pytest.mark.parametrize(
+    ("file_name", "channel", "number_of_frames"),
+    [
+        pytest.param("sample_0.asd", "TP", 142, id="file type 0"),
+        pytest.param("sample_1.asd", "TP", 197, id="file type 1"),
+    ],
+)
+def test_load_asd_frame_headers(file_name: str, channel: str, number_of_frames: int) -> None:
+    """Test the per-frame headers are decoded into a structured array on eager loads."""
+    file_path = RESOURCES / file_name
+    _, _, metadata = load_asd(file_path, channel)
+
+    frame_headers = metadata["frame_headers"]
+    assert frame_headers.shape == (number_of_frames,)
+    assert frame_headers.dtype.names == (
+        "frame_number",
+        "max_data",
+        "min_data",
+        "x_offset",
+        "y_offset",
+        "x_tilt",
+        "y_tilt",
+        "is_stimulated",
+    )
+    # Frames are numbered sequentially from one; a wrong header layout or stride would break this
+    np.testing.assert_array_equal(frame_headers["frame_number"], np.arange(1, number_of_frames + 1))
+    assert frame_headers["is_stimulated"].dtype == np.bool_
+
+
+@pytest.mark.parametrize(
+    ("file_name", "channel"),
+    [
+        pytest.param("sample_0.asd", "TP", id="file type 0"),
+        pytest.param("sample_1.asd", "TP", id="file type 1"),
+    ],
+)
+def test_load_asd_parse_colormap(file_name: str, channel: str) -> None:
+    """Test that requesting colour map parsing does not change the decoded data."""
+    file_path = RESOURCES / file_name
+    frames, pixel_to_nm_scaling, _ = load_asd(file_path, channel)
+    colormap_frames, colormap_pixel_to_nm_scaling, _ = load_asd(file_path, channel, parse_colormap=True)
+
+    assert colormap_pixel_to_nm_scaling == pixel_to_nm_scaling
+    np.testing.assert_array_equal(colormap_frames, frames)
@@ -1,12 +1,27 @@
 """Test the reading and writing of data from / to files."""
 
+from io import BytesIO
 from pathlib import Path
 
 import numpy as np
 import h5py
 
 
-from AFMReader.io import unpack_hdf5
+from AFMReader.io import read_record, unpack_hdf5
+
+
+def test_read_record() -> None:
+    """Test decoding a fixed-layout binary record into a structured scalar in a single read."""
+    dtype = np.dtype([("magic", "<u4"), ("version", "<i2"), ("scan_size", "<f8")])
+    open_file = BytesIO(np.array([(7, 3, 2.5)], dtype=dtype).tobytes() + b"trailing")
+
+    record = read_record(open_file, dtype)
+
+    assert record["magic"] == 7
+    assert record["version"] == 3
+    assert record["scan_size"] == 2.5
+    # Exactly one record's worth of bytes is consumed
+    assert open_file.read() == b"trailing"
 
 
 def test_unpack_hdf5_all_together_group_path_default(tmp_path: Path) -> None:
@@ -73,6 +88,39 @@ def test_unpack_hdf5_all_together_group_path_non_standard(tmp_path: Path) -> Non
     np.testing.assert_equal(result, expected)
 
 
+def test_unpack_hdf5_pack_structured(tmp_path: Path) -> None:
+    """Test packing groups of equal-length 1-D arrays into a structured array."""
+    to_save = {
+        "a": 1,
+        "metadata": {"time": np.array([0.0, 0.5, 1.0]), "height": np.array([7, 8, 9])},
+        "mixed": {"b": np.array([1, 2, 3]), "c": "test"},
+    }
+
+    group_path = "/"
+
+    # Manually save the dictionary to HDF5 format
+    with h5py.File(tmp_path / "hdf5_file_pack_structured.hdf5", "w") as f:
+        # Write the datasets and groups to the file without using the dict_to_hdf5 function
+        f.create_dataset("a", data=to_save["a"])
+        metadata = f.create_group("metadata")
+        metadata.create_dataset("time", data=to_save["metadata"]["time"])
+        metadata.create_dataset("height", data=to_save["metadata"]["height"])
+        mixed = f.create_group("mixed")
+        mixed.create_dataset("b", data=to_save["mixed"]["b"])
+        mixed.create_dataset("c", data=to_save["mixed"]["c"])
+
+    # Load it back in and check the qualifying group is packed into a structured array
+    with h5py.File(tmp_path / "hdf5_file_pack_structured.hdf5", "r") as f:
+        result = unpack_hdf5(open_hdf5_file=f, group_path=group_path, pack_structured=True)
+
+    assert result["a"] == to_save["a"]
+    assert result["metadata"].dtype.names == ("height", "time")
+    np.testing.assert_equal(result["metadata"]["time"], to_save["metadata"]["time"])
+    np.testing.assert_equal(result["metadata"]["height"], to_save["metadata"]["height"])
+    # Groups containing non-array or ragged members stay as dictionaries
+    np.testing.assert_equal(result["mixed"], to_save["mixed"])
+
+
 def test_unpack_hdf5_int(tmp_path: Path) -> None:
     """Test loading a dictionary with an integer from HDF5 format."""
     to_save = {"a": 1, "b": 2}